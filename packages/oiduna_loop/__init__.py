@@ -2,13 +2,32 @@
 Oiduna Loop Service
 
 Real-time audio loop engine with OSC and MIDI output.
+
+Public names are loaded lazily (PEP 562), so importing a light submodule
+such as oiduna_loop.state does not pull in the engine and its output
+dependencies.
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.2.0"
 
-from .engine import LoopEngine
-from .factory import create_loop_engine
-from .protocols import CommandSource, MidiOutput, OscOutput, StateSink
+if TYPE_CHECKING:
+    from .engine import LoopEngine
+    from .factory import create_loop_engine
+    from .protocols import CommandSource, MidiOutput, OscOutput, StateSink
+
+_LAZY_IMPORTS = {
+    "create_loop_engine": ".factory",
+    "LoopEngine": ".engine",
+    "MidiOutput": ".protocols",
+    "OscOutput": ".protocols",
+    "CommandSource": ".protocols",
+    "StateSink": ".protocols",
+}
 
 __all__ = [
     "create_loop_engine",
@@ -18,3 +37,12 @@ __all__ = [
     "CommandSource",
     "StateSink",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -20,6 +20,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Drift direction label indexed by (drift_ms > 0): ahead / behind schedule.
+# Shared with LoopEngine so step and clock drift logs use the same labels.
+_DRIFT_DIRECTION = ("ahead", "behind")
+
 
 class ClockGenerator:
     """
@@ -110,6 +114,9 @@ class ClockGenerator:
         if not self._midi.is_connected:
             return
 
+        cached_step_duration = 0.0
+        pulse_duration = 0.0
+
         while running_flag():
             if not state.playing:
                 # Reset anchor when not playing
@@ -123,8 +130,11 @@ class ClockGenerator:
                 self._clock_anchor_time = time.perf_counter()
                 self._pulse_count = 0
 
-            # Calculate pulse duration
-            pulse_duration = self.calculate_pulse_duration(state.step_duration)
+            # Pulse duration only changes with BPM: divide once per change
+            step_duration = state.step_duration
+            if step_duration != cached_step_duration:
+                cached_step_duration = step_duration
+                pulse_duration = self.calculate_pulse_duration(step_duration)
             current_time = time.perf_counter()
 
             # === Drift detection ===
@@ -166,8 +176,8 @@ class ClockGenerator:
             # Advance pulse count
             self._pulse_count += 1
 
-            # Drift-corrected wait: calculate expected time for next pulse
-            expected_next = self._clock_anchor_time + (self._pulse_count * pulse_duration)
+            # Drift-corrected wait: next pulse is one pulse after this one
+            expected_next = expected_time + pulse_duration
             wait_time = max(0, expected_next - time.perf_counter())
             await asyncio.sleep(wait_time)
 
@@ -179,7 +189,7 @@ class ClockGenerator:
             drift_ms: Detected drift in milliseconds
             current_time: Current perf_counter time
         """
-        direction = "behind" if drift_ms > 0 else "ahead"
+        direction = _DRIFT_DIRECTION[drift_ms > 0]
         logger.warning(
             f"MIDI clock drift reset: {drift_ms:.1f}ms {direction} "
             f"(threshold: {self.DRIFT_RESET_THRESHOLD_MS}ms)"
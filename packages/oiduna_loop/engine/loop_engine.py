@@ -38,8 +38,8 @@ from ..commands import (
 )
 from ..protocols import CommandSource, MidiOutput, OscOutput, StateSink
 from ..result import CommandResult
-from ..state import PlaybackState, RuntimeState
-from .clock_generator import ClockGenerator
+from ..state import STEPS_PER_BAR, STEPS_PER_BEAT, PlaybackState, RuntimeState
+from .clock_generator import _DRIFT_DIRECTION, ClockGenerator
 from .command_handler import CommandHandler
 from .note_scheduler import NoteScheduler
 from .session_loader import SessionLoader
@@ -64,6 +64,10 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Boundary masks: step & mask == 0 on beat / bar boundaries (power-of-two subdivisions)
+_BEAT_MASK = STEPS_PER_BEAT - 1
+_BAR_MASK = STEPS_PER_BAR - 1
+
 
 class LoopEngine:
     """
@@ -350,11 +354,15 @@ class LoopEngine:
         Change BPM with proper anchor reset for smooth transitions.
 
         Wrapper around CommandHandler with engine-specific drift anchor reset logic.
+        A BPM that leaves the tempo unchanged (e.g. a UI slider held in place
+        re-sending the same value) skips the anchor reset.
         """
+        old_bpm = self.state.bpm
+
         # Delegate to command handler
         result = self._command_handler.handle_bpm(payload)
 
-        if result.success:
+        if result.success and self.state.bpm != old_bpm:
             # Reset anchors during playback to prevent false drift detection
             # (engine-specific timing logic)
             if self.state.playing and self._step_anchor_time is not None:
@@ -585,16 +593,20 @@ class LoopEngine:
     # ================================================================
 
     async def run(self) -> None:
-        """Run the main loop"""
+        """
+        Run the main loop.
+
+        The loops run in a TaskGroup, so if one of them raises, the rest
+        are cancelled instead of being left running as orphaned tasks.
+        """
         self._running = True
 
-        await asyncio.gather(
-            self._command_loop(),
-            self._step_loop(),
-            self._clock_loop(),
-            self._note_off_loop(),
-            self._heartbeat_loop(),
-        )
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(self._command_loop())
+            tg.create_task(self._step_loop())
+            tg.create_task(self._clock_loop())
+            tg.create_task(self._note_off_loop())
+            tg.create_task(self._heartbeat_loop())
 
     async def _command_loop(self) -> None:
         """
@@ -653,37 +665,42 @@ class LoopEngine:
             # === Drift detection ===
             expected_time = self._step_anchor_time + (self._step_count * step_duration)
             drift_seconds = current_time - expected_time
-            drift_ms = drift_seconds * 1000
+            abs_drift_ms = abs(drift_seconds) * 1000
 
             # Update max drift statistic
-            if abs(drift_ms) > self._drift_stats["max_drift_ms"]:
-                self._drift_stats["max_drift_ms"] = abs(drift_ms)
-
-            # === Drift reset logic (inspired by Tidal) ===
-            if abs(drift_ms) > self.DRIFT_RESET_THRESHOLD_MS:
-                if self._suppress_next_drift_reset:
-                    # Suppress notification after BPM change (expected drift)
-                    self._step_anchor_time = current_time
-                    self._step_count = 0
-                    self._suppress_next_drift_reset = False
-                    logger.debug(
-                        f"Drift {drift_ms:.1f}ms suppressed (BPM change transition)"
-                    )
+            if abs_drift_ms > self._drift_stats["max_drift_ms"]:
+                self._drift_stats["max_drift_ms"] = abs_drift_ms
+
+            # Fast path: almost every step is within the warning threshold,
+            # so a single compare skips the whole escalation ladder
+            if abs_drift_ms > self.DRIFT_WARNING_THRESHOLD_MS:
+                drift_ms = drift_seconds * 1000
+
+                # === Drift reset logic (inspired by Tidal) ===
+                if abs_drift_ms > self.DRIFT_RESET_THRESHOLD_MS:
+                    if self._suppress_next_drift_reset:
+                        # Suppress notification after BPM change (expected drift)
+                        self._step_anchor_time = current_time
+                        self._step_count = 0
+                        self._suppress_next_drift_reset = False
+                        logger.debug(
+                            f"Drift {drift_ms:.1f}ms suppressed (BPM change transition)"
+                        )
+                    else:
+                        # Normal case: report drift reset to user
+                        await self._handle_drift_reset(drift_ms, current_time)
+
+                    # After reset, we're about to sleep for one step_duration.
+                    # Set step_count to 1 so next iteration expects: anchor + 1 * step_duration
+                    # This prevents infinite reset loop where drift = sleep_time each iteration.
+                    self._step_count = 1
+
+                    # Wait one step duration before next iteration
+                    await asyncio.sleep(step_duration)
+                    continue
                 else:
-                    # Normal case: report drift reset to user
-                    await self._handle_drift_reset(drift_ms, current_time)
-
-                # After reset, we're about to sleep for one step_duration.
-                # Set step_count to 1 so next iteration expects: anchor + 1 * step_duration
-                # This prevents infinite reset loop where drift = sleep_time each iteration.
-                self._step_count = 1
-
-                # Wait one step duration before next iteration
-                await asyncio.sleep(step_duration)
-                continue
-            elif abs(drift_ms) > self.DRIFT_WARNING_THRESHOLD_MS:
-                # Warning level drift - log but continue with normal correction
-                logger.debug(f"Clock drift warning: {drift_ms:.1f}ms")
+                    # Warning level drift - log but continue with normal correction
+                    logger.debug(f"Clock drift warning: {drift_ms:.1f}ms")
 
             # Execute current step: get messages, filter, apply hooks, send
             await self._execute_current_step()
@@ -747,16 +764,19 @@ class LoopEngine:
         Args:
             current_step: Current step number
         """
+        # Off-beat steps (3 of every 4) publish nothing
+        if current_step & _BEAT_MASK:
+            return
+
         # Publish position on beat boundaries (quarter notes) to reduce traffic
-        if current_step % 4 == 0:
-            await self._publisher.send_position(
-                self.state.position.to_dict(),
-                bpm=self.state.bpm,
-                transport=self.state.playback_state.value,
-            )
+        await self._publisher.send_position(
+            self.state.position.to_dict(),
+            bpm=self.state.bpm,
+            transport=self.state.playback_state.value,
+        )
 
         # Send tracks info at bar boundaries for Monitor page sync
-        if current_step % 16 == 0:
+        if not current_step & _BAR_MASK:
             await self._publisher.send_tracks(self._get_tracks_info())
 
     async def _execute_current_step(self) -> None:
@@ -814,7 +834,7 @@ class LoopEngine:
         skipped_steps = int(abs(drift_ms) / (step_duration * 1000))
 
         # Determine drift direction for logging
-        direction = "behind" if drift_ms > 0 else "ahead"
+        direction = _DRIFT_DIRECTION[drift_ms > 0]
 
         logger.warning(
             f"Clock drift reset: {drift_ms:.1f}ms {direction}, "
@@ -15,6 +15,7 @@ from __future__ import annotations
 import time
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any
 
 from oiduna_core.constants.steps import LOOP_STEPS
@@ -26,6 +27,21 @@ if TYPE_CHECKING:
 STEPS_PER_BEAT = 4   # 4 steps (16th notes) per beat
 STEPS_PER_BAR = 16   # 16 steps per bar (4/4 time)
 
+# Bit shifts for the power-of-two subdivisions (used by Position.advance)
+_BEAT_SHIFT = STEPS_PER_BEAT.bit_length() - 1  # step >> 2 = beat index
+_BAR_SHIFT = STEPS_PER_BAR.bit_length() - 1    # step >> 4 = bar index
+
+
+@lru_cache(maxsize=1024)
+def _derive_timing(bpm: float) -> tuple[float, float]:
+    """
+    Derive (step_duration, cps) from BPM.
+
+    Memoized: BPM values repeat heavily during tempo automation and
+    BPM sweeps, so repeated changes become a cache lookup.
+    """
+    return 60.0 / bpm / STEPS_PER_BEAT, bpm / 60.0 / STEPS_PER_BEAT
+
 
 class PlaybackState(Enum):
     """Playback state enumeration"""
@@ -34,7 +50,12 @@ class PlaybackState(Enum):
     PAUSED = "paused"
 
 
-@dataclass
+# Bound once for identity checks on the per-step `playing` path
+_PLAYING = PlaybackState.PLAYING
+_PAUSED = PlaybackState.PAUSED
+
+
+@dataclass(slots=True)
 class Position:
     """Current playback position"""
     step: int = 0
@@ -43,10 +64,21 @@ class Position:
     timestamp: float = 0.0
 
     def advance(self, loop_steps: int = LOOP_STEPS) -> None:
-        """Advance by one step"""
-        self.step = (self.step + 1) % loop_steps
-        self.beat = (self.step // STEPS_PER_BEAT) % STEPS_PER_BEAT
-        self.bar = self.step // STEPS_PER_BAR
+        """
+        Advance by one step.
+
+        loop_steps must be a power of two (the loop is fixed at 256),
+        so wrap-around and beat/bar derivation are pure bit operations.
+
+        Raises:
+            ValueError: If loop_steps is not a positive power of two
+        """
+        if loop_steps <= 0 or loop_steps & (loop_steps - 1):
+            raise ValueError(f"loop_steps must be a power of two, got {loop_steps}")
+        step = (self.step + 1) & (loop_steps - 1)
+        self.step = step
+        self.beat = (step >> _BEAT_SHIFT) & (STEPS_PER_BEAT - 1)
+        self.bar = step >> _BAR_SHIFT
         self.timestamp = time.time()
 
     def reset(self) -> None:
@@ -66,7 +98,7 @@ class Position:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class RuntimeState:
     """
     Simplified runtime state for ScheduledMessageBatch architecture.
@@ -91,23 +123,23 @@ class RuntimeState:
     _cps: float = 0.5  # cycles per second
 
     # Track filtering (mute/solo)
-    _track_mute: dict[str, bool] = field(default_factory=dict)
-    _track_solo: dict[str, bool] = field(default_factory=dict)
+    _muted_track_ids: set[str] = field(default_factory=set)
+    _soloed_track_ids: set[str] = field(default_factory=set)
     _known_track_ids: set[str] = field(default_factory=set)
     _active_track_ids: set[str] = field(default_factory=set)
 
     @property
     def playing(self) -> bool:
         """Check if actively playing"""
-        return self.playback_state == PlaybackState.PLAYING
+        return self.playback_state is _PLAYING
 
     @playing.setter
     def playing(self, value: bool) -> None:
         """Backwards compatible setter"""
         if value:
-            self.playback_state = PlaybackState.PLAYING
-        elif self.playback_state == PlaybackState.PLAYING:
-            self.playback_state = PlaybackState.PAUSED
+            self.playback_state = _PLAYING
+        elif self.playback_state is _PLAYING:
+            self.playback_state = _PAUSED
 
     @property
     def bpm(self) -> float:
@@ -136,8 +168,7 @@ class RuntimeState:
 
     def _update_timing(self) -> None:
         """Update timing calculations from BPM"""
-        self._step_duration = 60.0 / self._bpm / 4
-        self._cps = self._bpm / 60.0 / 4
+        self._step_duration, self._cps = _derive_timing(self._bpm)
 
     def advance_step(self) -> None:
         """Advance playback position by one step"""
@@ -152,7 +183,14 @@ class RuntimeState:
     # ============================================================
 
     def register_track(self, track_id: str) -> None:
-        """Register a track_id as known (called when loading messages)"""
+        """
+        Register a track_id as known (called when loading messages).
+
+        Called once per message on session load, so already-known
+        track_ids return early without recomputing the active set.
+        """
+        if track_id in self._known_track_ids:
+            return
         self._known_track_ids.add(track_id)
         self._update_active_tracks()
 
@@ -165,7 +203,10 @@ class RuntimeState:
         if track_id not in self._known_track_ids:
             return False
 
-        self._track_mute[track_id] = muted
+        if muted:
+            self._muted_track_ids.add(track_id)
+        else:
+            self._muted_track_ids.discard(track_id)
         self._update_active_tracks()
         return True
 
@@ -178,7 +219,10 @@ class RuntimeState:
         if track_id not in self._known_track_ids:
             return False
 
-        self._track_solo[track_id] = soloed
+        if soloed:
+            self._soloed_track_ids.add(track_id)
+        else:
+            self._soloed_track_ids.discard(track_id)
         self._update_active_tracks()
         return True
 
@@ -188,15 +232,13 @@ class RuntimeState:
 
         Solo takes priority: if any tracks are soloed, only those play.
         Otherwise, all non-muted tracks play.
+
+        Pure set algebra over the mute/solo sets, no per-track iteration.
         """
-        solo_tracks = {tid for tid, s in self._track_solo.items() if s}
-        if solo_tracks:
-            self._active_track_ids = solo_tracks
+        if self._soloed_track_ids:
+            self._active_track_ids = set(self._soloed_track_ids)
         else:
-            self._active_track_ids = {
-                tid for tid in self._known_track_ids
-                if not self._track_mute.get(tid, False)
-            }
+            self._active_track_ids = self._known_track_ids - self._muted_track_ids
 
     def is_track_active(self, track_id: str) -> bool:
         """
@@ -228,15 +270,17 @@ class RuntimeState:
         """
         # Fast path: no mute/solo AND no registered tracks → return as-is (no copy)
         # (If tracks are registered, we must filter unknown track_ids)
-        if not self._track_mute and not self._track_solo and not self._known_track_ids:
+        if not self._muted_track_ids and not self._soloed_track_ids and not self._known_track_ids:
             return messages
 
         # Slow path: filter active tracks + trackless messages
-        # Use walrus operator to get track_id only once per message
+        # Use walrus operator to get track_id only once per message,
+        # and test membership against the precomputed active set directly
+        active = self._active_track_ids
         return [
             msg for msg in messages
             if (track_id := msg.params.get("track_id")) is None
-            or self.is_track_active(track_id)
+            or track_id in active
         ]
 
     def get_active_track_ids(self) -> list[str]:
@@ -256,8 +300,8 @@ class RuntimeState:
             "position": self.position.to_dict(),
             "active_tracks": self.get_active_track_ids(),
             "known_tracks": sorted(self._known_track_ids),
-            "muted_tracks": sorted(tid for tid, m in self._track_mute.items() if m),
-            "soloed_tracks": sorted(tid for tid, s in self._track_solo.items() if s),
+            "muted_tracks": sorted(self._muted_track_ids),
+            "soloed_tracks": sorted(self._soloed_track_ids),
         }
 
     # ============================================================
@@ -105,7 +105,7 @@ class MockMidiOutput:
         self.all_notes_off_called = False
 
 
-@dataclass
+@dataclass(slots=True)
 class MockOscOutput:
     """
     Test double for OscOutput protocol.
@@ -4,8 +4,8 @@ Destination router - sends messages to appropriate destinations.
 
 from __future__ import annotations
 from typing import Protocol
-from collections import defaultdict
 import logging
+import sys
 
 from oiduna_scheduler.scheduler_models import ScheduledMessage
 from oiduna_scheduler.validators import OscValidator, MidiValidator
@@ -77,6 +77,8 @@ class DestinationRouter:
             sender: Sender implementation (OscDestinationSender, MidiDestinationSender)
             protocol: Protocol type ("osc" or "midi") for validation
         """
+        # Interned to match ScheduledMessage.from_dict, so lookups hit identity
+        destination_id = sys.intern(destination_id)
         self._senders[destination_id] = sender
         self._protocols[destination_id] = protocol
 
@@ -97,6 +99,8 @@ class DestinationRouter:
             messages: List of scheduled messages
 
         Messages are grouped by destination_id and sent together.
+        Several messages for a sender with use_bundle set go through
+        send_bundle(); otherwise each is sent with send_message().
         Protocol validation is performed before sending.
         Invalid messages are logged and skipped.
         """
@@ -111,9 +115,10 @@ class DestinationRouter:
             return
 
         # Slow path: multiple destinations - group and send
-        by_destination: Dict[str, List[ScheduledMessage]] = defaultdict(list)
+        # Plain dict + setdefault: no __missing__ call per new destination
+        by_destination: Dict[str, List[ScheduledMessage]] = {}
         for msg in messages:
-            by_destination[msg.destination_id].append(msg)
+            by_destination.setdefault(msg.destination_id, []).append(msg)
 
         # Send to each destination
         for dest_id, dest_messages in by_destination.items():
@@ -133,32 +138,37 @@ class DestinationRouter:
             logger.debug(f"Destination '{dest_id}' not registered, skipping {len(dest_messages)} messages")
             return
 
-        # Get protocol for this destination
+        # Resolve the validator once per destination, not per message
         protocol = self._protocols.get(dest_id, "osc")
-
-        # Validate and send each message
+        if protocol == "osc":
+            validate = self._osc_validator.validate_message
+        elif protocol == "midi":
+            validate = self._midi_validator.validate_message
+        else:
+            # Unknown protocol - skip validation
+            logger.warning(f"Unknown protocol '{protocol}' for destination '{dest_id}'")
+            validate = None
+
+        valid_params: list[dict] = []
         for msg in dest_messages:
             # Validate protocol compliance
-            if protocol == "osc":
-                validation_result = self._osc_validator.validate_message(msg.params)
-            elif protocol == "midi":
-                validation_result = self._midi_validator.validate_message(msg.params)
-            else:
-                # Unknown protocol - skip validation
-                logger.warning(f"Unknown protocol '{protocol}' for destination '{dest_id}'")
-                validation_result = None
-
-            # Check validation result
-            if validation_result and not validation_result.is_valid:
-                # Log validation errors and skip this message
-                logger.warning(
-                    f"Invalid {protocol.upper()} message for destination '{dest_id}': "
-                    f"{'; '.join(validation_result.errors)}"
-                )
-                continue
-
-            # Send valid message
-            sender.send_message(msg.params)
+            if validate is not None:
+                validation_result = validate(msg.params)
+                if not validation_result.is_valid:
+                    # Log validation errors and skip this message
+                    logger.warning(
+                        f"Invalid {protocol.upper()} message for destination '{dest_id}': "
+                        f"{'; '.join(validation_result.errors)}"
+                    )
+                    continue
+            valid_params.append(msg.params)
+
+        # Bundle only for destinations that opted in (use_bundle in destinations.yaml)
+        if len(valid_params) > 1 and getattr(sender, "use_bundle", False):
+            sender.send_bundle(valid_params)
+        else:
+            for params in valid_params:
+                sender.send_message(params)
 
     def get_registered_destinations(self) -> List[str]:
         """Get list of registered destination IDs."""
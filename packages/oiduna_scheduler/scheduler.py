@@ -33,6 +33,7 @@ class MessageScheduler:
         self._messages_by_step: Dict[int, List[ScheduledMessage]] = defaultdict(list)
         self._bpm: float = 120.0
         self._pattern_length: float = 4.0
+        self._message_count: int = 0
 
     def load_messages(self, batch: ScheduledMessageBatch) -> None:
         """
@@ -53,6 +54,7 @@ class MessageScheduler:
         # Index messages by step
         for msg in batch.messages:
             self._messages_by_step[msg.step].append(msg)
+        self._message_count = len(batch.messages)
 
     def get_messages_at_step(self, step: int) -> List[ScheduledMessage]:
         """
@@ -72,6 +74,7 @@ class MessageScheduler:
     def clear(self) -> None:
         """Clear all scheduled messages."""
         self._messages_by_step.clear()
+        self._message_count = 0
 
     @property
     def bpm(self) -> float:
@@ -85,8 +88,12 @@ class MessageScheduler:
 
     @property
     def message_count(self) -> int:
-        """Total number of scheduled messages."""
-        return sum(len(msgs) for msgs in self._messages_by_step.values())
+        """
+        Total number of scheduled messages.
+
+        Cached at load time: the loop engine checks this every step.
+        """
+        return self._message_count
 
     @property
     def occupied_steps(self) -> set[int]:
@@ -6,6 +6,7 @@ Validation happens in MARS - Oiduna trusts the input.
 """
 
 from __future__ import annotations
+import sys
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -66,16 +67,21 @@ class ScheduledMessage:
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> ScheduledMessage:
-        """Create from dictionary (for JSON deserialization)."""
+        """
+        Create from dictionary (for JSON deserialization).
+
+        destination_id is interned: a session repeats a handful of ids
+        across hundreds of messages, and the router compares them every step.
+        """
         return cls(
-            destination_id=data["destination_id"],
+            destination_id=sys.intern(data["destination_id"]),
             cycle=data["cycle"],
             step=data["step"],
             params=data["params"],
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScheduledMessageBatch:
     """
     Batch of scheduled messages for a session.
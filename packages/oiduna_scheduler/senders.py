@@ -59,9 +59,10 @@ class OscDestinationSender:
         [key, value, key, value, ...]
         """
         # Convert dict to flat list: [key, value, key, value, ...]
+        # (+= of a pair tuple avoids a temporary list per parameter)
         args: List[Any] = []
         for key, value in params.items():
-            args.extend([key, value])
+            args += (key, value)
 
         self._client.send_message(self.address, args)
 
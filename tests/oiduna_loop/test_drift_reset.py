@@ -8,6 +8,7 @@ after large clock drifts (e.g., CPU spikes, sleep/wake).
 from __future__ import annotations
 
 import time
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -131,6 +132,38 @@ class TestLoopEngineDriftReset:
         await test_engine._handle_drift_reset(55.0, time.perf_counter())
         assert test_engine._drift_stats["reset_count"] == 3
 
+    @pytest.mark.asyncio
+    async def test_moderate_drift_keeps_step_grid_in_phase_with_clock(
+        self,
+        test_engine: LoopEngine,
+        mock_publisher: MockStateSink,
+    ):
+        """Drift below the reset threshold must not move the step anchor.
+
+        The catch-up wait in _wait_for_next_step absorbs it against the
+        fixed anchor, so steps stay in phase with the MIDI clock anchor.
+        """
+        anchor = time.perf_counter() - 0.035  # 35ms behind at step 0
+        test_engine._step_anchor_time = anchor
+        test_engine._clock_generator._clock_anchor_time = anchor
+        test_engine.state.playback_state = PlaybackState.PLAYING
+        test_engine._running = True
+
+        async def run_one_step() -> None:
+            test_engine._running = False
+
+        with (
+            patch.object(test_engine, "_execute_current_step", side_effect=run_one_step),
+            patch.object(test_engine, "_wait_for_next_step", new=AsyncMock()),
+        ):
+            await test_engine._step_loop()
+
+        assert test_engine._step_anchor_time == anchor
+        assert test_engine._step_anchor_time == test_engine._clock_generator._clock_anchor_time
+        assert test_engine._step_count == 0
+        assert test_engine._drift_stats["reset_count"] == 0
+        assert mock_publisher.get_messages_by_type("error_msg") == []
+
     @pytest.mark.asyncio
     async def test_drift_direction_logged_correctly(self, test_engine: LoopEngine):
         """Drift direction (behind/ahead) should be calculated correctly."""
@@ -384,6 +417,24 @@ class TestDriftResetIntegration:
         assert clock_gen._clock_anchor_time > old_clock_anchor
         assert clock_gen._pulse_count == 0
 
+    def test_redundant_bpm_does_not_reset_anchor(
+        self,
+        test_engine: LoopEngine,
+    ):
+        """Re-sending the current BPM should leave the anchor untouched."""
+        test_engine.handle_play({})
+        test_engine._handle_bpm({"bpm": 140})
+        test_engine._step_anchor_time = anchor = time.perf_counter() - 10.0
+        test_engine._step_count = 80
+        test_engine._suppress_next_drift_reset = False
+
+        result = test_engine._handle_bpm({"bpm": 140})
+
+        assert result.success
+        assert test_engine._step_anchor_time == anchor
+        assert test_engine._step_count == 80
+        assert not test_engine._suppress_next_drift_reset
+
     def test_bpm_change_when_stopped_does_not_reset_anchor(
         self,
         test_engine: LoopEngine,
@@ -7,7 +7,9 @@ using mock dependencies (DI pattern).
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 
@@ -287,3 +289,36 @@ class TestLoopEngineIntegration:
         active = test_engine.state.get_active_track_ids()
         assert len(active) == 1
         assert "hihat" in active
+
+
+class TestLoopEngineRun:
+    """Test the main run() loop supervision."""
+
+    @pytest.mark.asyncio
+    async def test_failing_loop_cancels_the_others(self, test_engine: LoopEngine):
+        """If one loop raises, run() should cancel the remaining loops."""
+        cancelled: list[str] = []
+
+        def idle(name: str):
+            async def loop() -> None:
+                try:
+                    await asyncio.sleep(3600)
+                except asyncio.CancelledError:
+                    cancelled.append(name)
+                    raise
+            return loop
+
+        async def failing() -> None:
+            raise RuntimeError("step loop crashed")
+
+        with (
+            patch.object(test_engine, "_command_loop", idle("command")),
+            patch.object(test_engine, "_step_loop", failing),
+            patch.object(test_engine, "_clock_loop", idle("clock")),
+            patch.object(test_engine, "_note_off_loop", idle("note_off")),
+            patch.object(test_engine, "_heartbeat_loop", idle("heartbeat")),
+            pytest.raises(ExceptionGroup),
+        ):
+            await asyncio.wait_for(test_engine.run(), timeout=1.0)
+
+        assert sorted(cancelled) == ["clock", "command", "heartbeat", "note_off"]
@@ -1,9 +1,26 @@
 """Tests for OscSender address configuration."""
 
+from unittest.mock import patch
+
 import pytest
 from oiduna_loop.output.osc_sender import OscSender
 
 
+@pytest.fixture
+def connected_sender():
+    """
+    Provide a connected OscSender.
+
+    The UDP client's send_message is patched so tests never send to the
+    default SuperDirt port, where a real server may be listening.
+    """
+    sender = OscSender()
+    sender.connect()
+    with patch.object(sender._client, "send_message"):
+        yield sender
+    sender.disconnect()
+
+
 class TestOscSenderAddress:
     """Tests for OscSender address parameter."""
 
@@ -38,16 +55,15 @@ class TestOscSenderSend:
         result = sender.send({"s": "bd", "gain": 0.8})
         assert result is False
 
-    def test_send_with_connected_sender(self):
+    def test_send_with_connected_sender(self, connected_sender: OscSender):
         """Verify send() works when connected."""
-        sender = OscSender()
-        sender.connect()
+        send_message = connected_sender._client.send_message
 
-        # send should succeed (even if no server is listening)
-        result = sender.send({"s": "bd", "gain": 0.8, "pan": 0.5})
+        result = connected_sender.send({"s": "bd", "gain": 0.8, "pan": 0.5})
         assert result is True
-
-        sender.disconnect()
+        send_message.assert_called_once_with(
+            "/dirt/play", ["s", "bd", "gain", 0.8, "pan", 0.5]
+        )
 
     def test_default_constructor(self):
         """Verify default constructor sets correct defaults."""
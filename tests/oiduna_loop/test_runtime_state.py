@@ -1,9 +1,12 @@
 """Tests for RuntimeState (ScheduledMessageBatch architecture)."""
 
+import pytest
+
 from oiduna_loop.state.runtime_state import (
     PlaybackState,
     Position,
     RuntimeState,
+    _derive_timing,
 )
 from oiduna_scheduler.scheduler_models import ScheduledMessage
 
@@ -18,6 +21,10 @@ class TestPosition:
         assert pos.bar == 0
         assert pos.beat == 0
 
+    def test_slotted(self) -> None:
+        """Test Position uses __slots__ (no per-instance __dict__)."""
+        assert not hasattr(Position(), "__dict__")
+
     def test_advance(self) -> None:
         """Test advancing position."""
         pos = Position()
@@ -50,6 +57,14 @@ class TestPosition:
         assert pos.beat == 0
         assert pos.bar == 0
 
+    @pytest.mark.parametrize("loop_steps", [0, 12, 100])
+    def test_advance_rejects_non_power_of_two(self, loop_steps: int) -> None:
+        """Test that bitmask wrapping refuses loop lengths it would get wrong."""
+        pos = Position(step=11)
+        with pytest.raises(ValueError, match="power of two"):
+            pos.advance(loop_steps)
+        assert pos.step == 11
+
     def test_reset(self) -> None:
         """Test resetting position."""
         pos = Position(step=100, bar=5, beat=2)
@@ -102,6 +117,17 @@ class TestRuntimeStateBasics:
         assert state.step_duration == 60.0 / 140.0 / 4
         assert state.cps == 140.0 / 60.0 / 4
 
+    def test_set_bpm_reuses_cached_timing(self) -> None:
+        """Test repeated BPM values hit the timing cache."""
+        state = RuntimeState()
+        state.set_bpm(133.0)
+        hits = _derive_timing.cache_info().hits
+
+        state.set_bpm(120.0)
+        state.set_bpm(133.0)
+        assert _derive_timing.cache_info().hits > hits
+        assert state.step_duration == 60.0 / 133.0 / 4
+
     def test_bpm_clamping(self) -> None:
         """Test BPM is clamped to valid range."""
         state = RuntimeState()
@@ -139,6 +165,17 @@ class TestTrackRegistration:
         assert "kick" in state._known_track_ids
         assert state.is_track_active("kick")
 
+    def test_register_known_track_keeps_mute_state(self) -> None:
+        """Test re-registering a known track leaves its mute state intact."""
+        state = RuntimeState()
+        state.register_track("kick")
+        state.set_track_mute("kick", True)
+
+        state.register_track("kick")
+
+        assert state._known_track_ids == {"kick"}
+        assert not state.is_track_active("kick")
+
     def test_register_multiple_tracks(self) -> None:
         """Test registering multiple tracks."""
         state = RuntimeState()
@@ -13,19 +13,34 @@ These tests are marked with @pytest.mark.slow and can be run with:
     pytest -m "not slow"    # Skip slow tests
 
 Environment variable RUN_STABILITY_TESTS=1 enables these tests.
+
+All tests in this module share the "stability" xdist group, so under
+    pytest -n auto --dist loadgroup
+they run serially on one worker (parallel timing tests would steal each
+other's CPU) while the rest of the suite is distributed around them.
 """
 
 from __future__ import annotations
 
+import array
 import asyncio
+import contextlib
+import functools
+import heapq
+import logging
+import math
 import os
+import statistics
 import time
-from typing import Any
+from collections.abc import Awaitable, Callable
 
 import pytest
 
 from oiduna_loop.engine import LoopEngine
 from oiduna_loop.tests.mocks import MockCommandSource, MockMidiOutput, MockOscOutput, MockStateSink
+from oiduna_scheduler.scheduler_models import ScheduledMessage, ScheduledMessageBatch
+
+logger = logging.getLogger(__name__)
 
 # Skip stability tests unless explicitly enabled
 STABILITY_TESTS_ENABLED = os.environ.get("RUN_STABILITY_TESTS", "0") == "1"
@@ -34,6 +49,8 @@ stability_test = pytest.mark.skipif(
     reason="Stability tests disabled. Set RUN_STABILITY_TESTS=1 to enable.",
 )
 
+pytestmark = pytest.mark.xdist_group(name="stability")
+
 
 class StabilityTestEngine:
     """Helper class for running stability tests with timing measurements."""
@@ -52,38 +69,60 @@ class StabilityTestEngine:
             publisher=publisher,
         )
         self.engine._register_handlers()
-        self.step_times: list[float] = []
+        self.step_times = array.array("d")
+        self._step_time_count = 0
+        self._last_step_time: float | None = None
         self.original_process_step = None
 
-    def start_timing_capture(self) -> None:
-        """Start capturing step timing data."""
-        self.step_times = []
-        self._last_step_time = time.perf_counter()
+    def start_timing_capture(self, expected_count: int = 0) -> None:
+        """
+        Start capturing step timing data.
+
+        Preallocates a raw-double buffer for expected_count intervals
+        (duration / step_duration) so recording never reallocates.
+        """
+        self.step_times = array.array("d", bytes(8 * expected_count))
+        self._step_time_count = 0
+        self._last_step_time = None
 
     def record_step_time(self) -> None:
-        """Record a step occurrence time."""
+        """
+        Record the interval since the previous step.
+
+        The first step after start_timing_capture() only sets the
+        reference point, so every stored value is a true step interval.
+        """
         now = time.perf_counter()
-        if self.step_times:
-            # Record interval since last step
-            self.step_times.append(now - self._last_step_time)
+        last = self._last_step_time
         self._last_step_time = now
+        if last is None:
+            return
+        i = self._step_time_count
+        if i < len(self.step_times):
+            self.step_times[i] = now - last
+        else:
+            self.step_times.append(now - last)
+        self._step_time_count = i + 1
 
     def get_timing_stats(self) -> dict[str, float]:
         """Get timing statistics from captured data."""
-        if not self.step_times:
+        if not self._step_time_count:
             return {"count": 0, "mean_ms": 0, "max_deviation_ms": 0}
 
+        step_times = memoryview(self.step_times)[:self._step_time_count]
+
         expected_duration = self.engine.state.step_duration
         expected_ms = expected_duration * 1000
 
-        deviations = [abs(t * 1000 - expected_ms) for t in self.step_times]
+        # Deviation in seconds, scaled once at the end
+        deviations = [abs(t - expected_duration) for t in step_times]
 
         return {
-            "count": len(self.step_times),
+            "count": len(step_times),
             "expected_ms": expected_ms,
-            "mean_ms": sum(self.step_times) * 1000 / len(self.step_times),
-            "max_deviation_ms": max(deviations) if deviations else 0,
-            "mean_deviation_ms": sum(deviations) / len(deviations) if deviations else 0,
+            "mean_ms": statistics.fmean(step_times) * 1000,
+            "max_deviation_ms": max(deviations) * 1000,
+            "mean_deviation_ms": statistics.fmean(deviations) * 1000,
         }
 
 
@@ -98,28 +137,126 @@ def stability_engine(
     return StabilityTestEngine(mock_osc, mock_midi, mock_commands, mock_publisher)
 
 
-def create_dense_session(num_tracks: int = 8) -> dict[str, Any]:
-    """Create a session with many tracks and events for stress testing."""
-    tracks = {}
-    sequences = {}
+@functools.lru_cache(maxsize=32)
+def create_dense_session(num_tracks: int = 8) -> ScheduledMessageBatch:
+    """
+    Create a session with many tracks and events for stress testing.
+
+    Each track shares one params dict across all of its messages,
+    so the batch allocates one dict per track rather than per event.
+    Memoized per num_tracks: the batch is frozen and loading never
+    mutates message params, so the same instance can be reloaded.
+    """
+    messages: list[ScheduledMessage] = []
 
     for i in range(num_tracks):
         track_id = f"track_{i}"
-        tracks[track_id] = {
-            "meta": {"mute": False, "solo": False},
-            "sound": {"s": f"sound_{i}"},
-            "fx": {"room": 0.2, "delay": 0.1},
-        }
-        # Events on every step
-        sequences[track_id] = {
-            "events": [{"step": s, "velocity": 0.8} for s in range(16)]
+        params = {
+            "track_id": track_id,
+            "s": f"sound_{i}",
+            "gain": 0.8,
+            "room": 0.2,
+            "delay": 0.1,
         }
+        # Events on each of the first 16 steps
+        messages.extend(
+            ScheduledMessage(
+                destination_id="superdirt",
+                cycle=step / 64,
+                step=step,
+                params=params,
+            )
+            for step in range(16)
+        )
+
+    return ScheduledMessageBatch(
+        messages=tuple(messages),
+        bpm=120.0,
+        destinations=frozenset({"superdirt"}),
+    )
+
+
+def load_session(engine: LoopEngine, batch: ScheduledMessageBatch) -> None:
+    """Load a batch like SessionLoader.load_session, minus destination checks."""
+    engine._message_scheduler.load_messages(batch)
+    engine.state.set_bpm(batch.bpm)
+    for msg in batch.messages:
+        engine.state.register_track(msg.params["track_id"])
+
+
+async def run_step_loop(
+    engine: LoopEngine,
+    duration: float,
+    on_step: Callable[[int, float], Awaitable[None]] | None = None,
+    *,
+    drift_reset: bool = True,
+) -> int:
+    """
+    Run a deadline-scheduled step loop for `duration` seconds.
+
+    Sleeps until the next step boundary (anchor + n * step_duration)
+    instead of polling every 1 ms. Drift is measured when a step is due.
+    With drift_reset, anything beyond DRIFT_RESET_THRESHOLD_MS triggers
+    _handle_drift_reset as in LoopEngine._step_loop; without it, late
+    steps catch up against the fixed anchor so raw lateness is measured.
+    on_step(steps, drift_seconds) is awaited after each step fires and
+    may itself block to simulate a CPU spike.
+
+    Returns the number of steps fired.
+    """
+    # Loop-invariant lookups bound once (LOAD_FAST in the loop).
+    # All loop math is integer nanoseconds on perf_counter_ns, the same
+    # clock as the engine's float anchor.
+    perf_ns = time.perf_counter_ns
+    sleep = asyncio.sleep
+    threshold_ns = round(engine.DRIFT_RESET_THRESHOLD_MS * 1_000_000)
+    handle_drift_reset = engine._handle_drift_reset
+    step_ns = round(engine.state.step_duration * 1e9)
+    fired = 0
+
+    async def drive() -> None:
+        # Runs until wait_for cancels it, so the clock is read only for
+        # deadline math, never for a stop condition
+        nonlocal fired
+        # Next step deadline, advanced by step_ns as steps fire
+        # (equal to anchor + _step_count * step_duration)
+        expected_ns = perf_ns()
+        engine._step_anchor_time = expected_ns / 1e9
+        engine._step_count = 0
+        steps = 0
+        # Tracked locally, written back to _drift_stats once at the end
+        max_drift_ns = round(engine._drift_stats["max_drift_ms"] * 1_000_000)
+
+        try:
+            while True:
+                now_ns = perf_ns()
+                if now_ns < expected_ns:
+                    await sleep((expected_ns - now_ns) / 1e9)
+                    continue
+
+                drift_ns = now_ns - expected_ns
+                if drift_ns > max_drift_ns:
+                    max_drift_ns = drift_ns
 
-    return {
-        "environment": {"bpm": 120.0},
-        "tracks": tracks,
-        "sequences": sequences,
-    }
+                if drift_reset and drift_ns > threshold_ns:
+                    # Engine API is float ms / seconds; convert only here
+                    await handle_drift_reset(drift_ns / 1e6, now_ns / 1e9)
+                    # Reset re-anchors at now with _step_count = 0
+                    expected_ns = now_ns
+                    continue
+
+                engine._step_count += 1
+                expected_ns += step_ns
+                steps += 1
+                if on_step is not None:
+                    await on_step(steps, drift_ns / 1e9)
+        finally:
+            engine._drift_stats["max_drift_ms"] = max_drift_ns / 1e6
+            fired = steps
+
+    with contextlib.suppress(TimeoutError):
+        await asyncio.wait_for(drive(), timeout=duration)
+    return fired
 
 
 # =============================================================================
@@ -141,48 +278,25 @@ class TestLongRunningTiming:
         engine.state.set_bpm(120)  # 125ms per step
         engine.handle_play({})
 
-        # Track timing manually
-        step_intervals: list[float] = []
-        last_time = time.perf_counter()
-        start_time = last_time
-
         duration_seconds = 10
-        expected_step_duration = engine.state.step_duration
-
-        # Run simplified timing loop
-        while time.perf_counter() - start_time < duration_seconds:
-            if engine._step_anchor_time is None:
-                engine._step_anchor_time = time.perf_counter()
-                engine._step_count = 0
-
-            current_time = time.perf_counter()
-            expected_time = engine._step_anchor_time + (
-                engine._step_count * expected_step_duration
-            )
-
-            if current_time >= expected_time:
-                # Record interval
-                if engine._step_count > 0:
-                    step_intervals.append(current_time - last_time)
-                last_time = current_time
-                engine._step_count += 1
+        stability_engine.start_timing_capture(
+            int(duration_seconds / engine.state.step_duration)
+        )
 
-                # Drift tracking
-                drift_ms = (current_time - expected_time) * 1000
-                if abs(drift_ms) > engine._drift_stats["max_drift_ms"]:
-                    engine._drift_stats["max_drift_ms"] = abs(drift_ms)
+        async def on_step(steps: int, drift: float) -> None:
+            stability_engine.record_step_time()
 
-            await asyncio.sleep(0.001)
+        await run_step_loop(engine, duration_seconds, on_step, drift_reset=False)
 
         engine.handle_stop({})
 
         # Analyze results
-        assert len(step_intervals) > 0, "No steps recorded"
+        stats = stability_engine.get_timing_stats()
+        assert stats["count"] > 0, "No steps recorded"
 
-        expected_ms = expected_step_duration * 1000
-        deviations = [abs(interval * 1000 - expected_ms) for interval in step_intervals]
-        max_deviation = max(deviations)
-        mean_deviation = sum(deviations) / len(deviations)
+        expected_ms = stats["expected_ms"]
+        max_deviation = stats["max_deviation_ms"]
+        mean_deviation = stats["mean_deviation_ms"]
 
         # Assertions
         assert max_deviation < 20.0, f"Max timing deviation too high: {max_deviation:.2f}ms"
@@ -194,7 +308,7 @@ class TestLongRunningTiming:
         )
 
         print("\n=== Long Running Test Results (10s) ===")
-        print(f"Steps executed: {len(step_intervals)}")
+        print(f"Step intervals measured: {stats['count']}")
         print(f"Expected step duration: {expected_ms:.2f}ms")
         print(f"Max deviation: {max_deviation:.2f}ms")
         print(f"Mean deviation: {mean_deviation:.2f}ms")
@@ -210,36 +324,29 @@ class TestLongRunningTiming:
         engine.state.set_bpm(140)  # Faster BPM
         engine.handle_play({})
 
-        step_count = 0
-        start_time = time.perf_counter()
         duration_seconds = 30
         expected_step_duration = engine.state.step_duration
+        # Size the interval buffer for the whole run up front
+        expected_steps = int(duration_seconds / expected_step_duration)
+        stability_engine.start_timing_capture(expected_steps)
 
-        engine._step_anchor_time = start_time
-        engine._step_count = 0
-
-        while time.perf_counter() - start_time < duration_seconds:
-            current_time = time.perf_counter()
-            expected_time = engine._step_anchor_time + (
-                engine._step_count * expected_step_duration
-            )
-
-            if current_time >= expected_time:
-                step_count += 1
-                engine._step_count += 1
-
-                drift_ms = (current_time - expected_time) * 1000
-                if abs(drift_ms) > engine._drift_stats["max_drift_ms"]:
-                    engine._drift_stats["max_drift_ms"] = abs(drift_ms)
+        async def on_step(steps: int, drift: float) -> None:
+            stability_engine.record_step_time()
 
-            await asyncio.sleep(0.001)
+        step_count = await run_step_loop(
+            engine, duration_seconds, on_step, drift_reset=False
+        )
 
         engine.handle_stop({})
 
+        stats = stability_engine.get_timing_stats()
+        assert stats["count"] == step_count - 1, (
+            f"Captured {stats['count']} intervals for {step_count} steps"
+        )
+
         drift_stats = engine.get_drift_stats()
 
         # At 140 BPM, expect ~280 steps in 30 seconds
-        expected_steps = int(duration_seconds / expected_step_duration)
         assert step_count >= expected_steps * 0.95, (
             f"Too few steps: {step_count} < {expected_steps * 0.95}"
         )
@@ -252,6 +359,7 @@ class TestLongRunningTiming:
         print(f"Steps executed: {step_count}")
         print(f"Expected steps: ~{expected_steps}")
         print(f"Max drift: {drift_stats['max_drift_ms']:.2f}ms")
+        print(f"Max interval deviation: {stats['max_deviation_ms']:.2f}ms")
         print(f"Drift resets: {drift_stats['reset_count']}")
 
 
@@ -295,13 +403,12 @@ class TestBPMChangeStress:
                 # Verify anchors were reset (for all but first iteration)
                 if i > 0:
                     # Anchor should be recent (within 100ms)
-                    anchor_age = time.perf_counter() - engine._step_anchor_time
+                    now = time.perf_counter()
+                    anchor_age = now - engine._step_anchor_time
                     if anchor_age > 0.1:
                         errors.append(f"Step anchor not reset for BPM {bpm}")
 
-                    clock_anchor_age = (
-                        time.perf_counter() - engine._clock_generator._clock_anchor_time
-                    )
+                    clock_anchor_age = now - engine._clock_generator._clock_anchor_time
                     if clock_anchor_age > 0.1:
                         errors.append(f"Clock anchor not reset for BPM {bpm}")
 
@@ -370,45 +477,19 @@ class TestCPUSpikeRecovery:
         engine.state.set_bpm(120)
         engine.handle_play({})
 
-        start_time = time.perf_counter()
-        engine._step_anchor_time = start_time
-        engine._step_count = 0
-
         step_duration = engine.state.step_duration
         steps_before_spike = 0
-        spike_triggered = False
-
-        # Run for a bit, then simulate spike
-        while time.perf_counter() - start_time < 5:
-            current_time = time.perf_counter()
-            expected_time = engine._step_anchor_time + (
-                engine._step_count * step_duration
-            )
-
-            # Calculate drift
-            drift_ms = (current_time - expected_time) * 1000
-
-            # Update max drift
-            if abs(drift_ms) > engine._drift_stats["max_drift_ms"]:
-                engine._drift_stats["max_drift_ms"] = abs(drift_ms)
 
-            # Check if drift exceeds threshold
-            if abs(drift_ms) > engine.DRIFT_RESET_THRESHOLD_MS:
-                # Trigger drift reset
-                await engine._handle_drift_reset(drift_ms, current_time)
-                spike_triggered = True
+        async def on_step(steps: int, drift: float) -> None:
+            nonlocal steps_before_spike
+            # Simulate CPU spike after 20 steps: block the event loop so
+            # the step overruns its slot and the next one fires 150ms late
+            if steps == 20:
+                steps_before_spike = steps
+                logger.debug("Simulating 150ms CPU spike at step %d", steps)
+                time.sleep(step_duration + 0.150)
 
-            if current_time >= expected_time:
-                engine._step_count += 1
-                steps_before_spike += 1
-
-                # Simulate CPU spike after 20 steps
-                if steps_before_spike == 20 and not spike_triggered:
-                    print(f"Simulating 150ms CPU spike at step {steps_before_spike}")
-                    await asyncio.sleep(0.150)  # 150ms spike
-                    continue
-
-            await asyncio.sleep(0.001)
+        await run_step_loop(engine, 5, on_step)
 
         engine.handle_stop({})
 
@@ -436,40 +517,24 @@ class TestCPUSpikeRecovery:
         engine.handle_play({})
 
         start_time = time.perf_counter()
-        engine._step_anchor_time = start_time
-        engine._step_count = 0
-
         step_duration = engine.state.step_duration
         spike_count = 0
-        spike_intervals = [1.0, 2.5, 4.0]  # Spike at 1s, 2.5s, 4s
-
-        while time.perf_counter() - start_time < 5:
-            current_time = time.perf_counter()
-            elapsed = current_time - start_time
-
-            # Check if we should trigger a spike
-            if spike_count < len(spike_intervals):
-                if elapsed >= spike_intervals[spike_count]:
-                    print(f"Spike {spike_count + 1} at {elapsed:.1f}s")
-                    await asyncio.sleep(0.100)  # 100ms spike
-                    spike_count += 1
-                    continue
-
-            expected_time = engine._step_anchor_time + (
-                engine._step_count * step_duration
-            )
-            drift_ms = (current_time - expected_time) * 1000
-
-            if abs(drift_ms) > engine._drift_stats["max_drift_ms"]:
-                engine._drift_stats["max_drift_ms"] = abs(drift_ms)
-
-            if abs(drift_ms) > engine.DRIFT_RESET_THRESHOLD_MS:
-                await engine._handle_drift_reset(drift_ms, current_time)
-
-            if current_time >= expected_time:
-                engine._step_count += 1
-
-            await asyncio.sleep(0.001)
+        # Spike at 1s, 2.5s, 4s; absolute times, consumed in order
+        spikes = iter([start_time + t for t in (1.0, 2.5, 4.0)])
+        next_spike = next(spikes, math.inf)
+
+        async def on_step(steps: int, drift: float) -> None:
+            nonlocal spike_count, next_spike
+            # Spikes land on the first step boundary past each interval
+            now = time.perf_counter()
+            if now >= next_spike:
+                spike_count += 1
+                logger.debug("Spike %d at %.1fs", spike_count, now - start_time)
+                # Blocking stall; next step fires 100ms late
+                time.sleep(step_duration + 0.100)
+                next_spike = next(spikes, math.inf)
+
+        await run_step_loop(engine, 5, on_step)
 
         engine.handle_stop({})
 
@@ -497,19 +562,10 @@ class TestConcurrentLoops:
     @pytest.mark.asyncio
     async def test_concurrent_step_and_clock_loops(
         self,
-        mock_osc: MockOscOutput,
-        mock_midi: MockMidiOutput,
-        mock_commands: MockCommandSource,
-        mock_publisher: MockStateSink,
+        stability_engine: StabilityTestEngine,
     ):
         """Run both loops concurrently and verify synchronization."""
-        engine = LoopEngine(
-            osc=mock_osc,
-            midi=mock_midi,
-            commands=mock_commands,
-            publisher=mock_publisher,
-        )
-        engine._register_handlers()
+        engine = stability_engine.engine
         engine.state.set_bpm(120)
         engine.handle_play({})
 
@@ -526,37 +582,32 @@ class TestConcurrentLoops:
         engine._clock_generator._clock_anchor_time = start_time
         engine._clock_generator._pulse_count = 0
 
-        # Capture anchor times for use in closures (mypy needs explicit types)
         step_anchor: float = start_time
         clock_anchor: float = start_time
-
-        async def step_loop():
-            nonlocal step_count
-            while time.perf_counter() - start_time < duration:
-                current = time.perf_counter()
-                expected = step_anchor + (
-                    engine._step_count * step_duration
-                )
-                if current >= expected:
-                    step_count += 1
-                    engine._step_count += 1
-                await asyncio.sleep(0.001)
-
-        async def clock_loop():
-            nonlocal pulse_count
-            clock = engine._clock_generator
-            while time.perf_counter() - start_time < duration:
-                current = time.perf_counter()
-                expected = clock_anchor + (
-                    clock._pulse_count * pulse_duration
-                )
-                if current >= expected:
-                    pulse_count += 1
-                    clock._pulse_count += 1
-                await asyncio.sleep(0.0005)  # Clock runs faster
-
-        # Run both loops concurrently
-        await asyncio.gather(step_loop(), clock_loop())
+        clock = engine._clock_generator
+
+        perf = time.perf_counter
+        sleep = asyncio.sleep
+
+        # One min-heap of (deadline, kind) instead of two polling loops:
+        # sleep to the earliest deadline, fire it, push its successor.
+        # Deadlines are anchor + count * period, so they never accumulate.
+        sched = [(step_anchor, "step"), (clock_anchor, "pulse")]
+        end_time = start_time + duration
+        while sched[0][0] < end_time:
+            when, kind = heapq.heappop(sched)
+            delay = when - perf()
+            if delay > 0:
+                await sleep(delay)
+            if kind == "step":
+                step_count += 1
+                engine._step_count += 1
+                next_when = step_anchor + engine._step_count * step_duration
+            else:
+                pulse_count += 1
+                clock._pulse_count += 1
+                next_when = clock_anchor + clock._pulse_count * pulse_duration
+            heapq.heappush(sched, (next_when, kind))
 
         engine.handle_stop({})
 
@@ -591,58 +642,34 @@ class TestHighEventDensity:
     @pytest.mark.asyncio
     async def test_16_tracks_all_steps(
         self,
-        mock_osc: MockOscOutput,
-        mock_midi: MockMidiOutput,
-        mock_commands: MockCommandSource,
-        mock_publisher: MockStateSink,
+        stability_engine: StabilityTestEngine,
     ):
         """Test with 16 tracks, events on every step."""
-        engine = LoopEngine(
-            osc=mock_osc,
-            midi=mock_midi,
-            commands=mock_commands,
-            publisher=mock_publisher,
-        )
-        engine._register_handlers()
+        engine = stability_engine.engine
 
         # Load dense session
         session = create_dense_session(num_tracks=16)
-        engine._handle_compile(session)
+        load_session(engine, session)
         engine.state.set_bpm(140)  # Fast BPM
         engine.handle_play({})
 
-        start_time = time.perf_counter()
-        engine._step_anchor_time = start_time
-        engine._step_count = 0
-
         duration = 5
         step_duration = engine.state.step_duration
-        processed_steps = 0
 
-        while time.perf_counter() - start_time < duration:
-            current = time.perf_counter()
-            expected = engine._step_anchor_time + (engine._step_count * step_duration)
+        # The batch is fixed for this test, so bind the per-step calls once
+        state = engine.state
+        position = state.position
+        get_messages = engine._message_scheduler.get_messages_at_step
+        filter_messages = state.filter_messages
+        advance_step = state.advance_step
 
-            drift_ms = (current - expected) * 1000
-            if abs(drift_ms) > engine._drift_stats["max_drift_ms"]:
-                engine._drift_stats["max_drift_ms"] = abs(drift_ms)
+        async def on_step(steps: int, drift: float) -> None:
+            # Simulate step processing (16 tracks × events)
+            _ = filter_messages(get_messages(position.step))
+            advance_step()
 
-            # Handle drift reset if threshold exceeded (just like real loop)
-            if abs(drift_ms) > engine.DRIFT_RESET_THRESHOLD_MS:
-                await engine._handle_drift_reset(drift_ms, current)
-
-            if current >= expected:
-                # Simulate step processing (16 tracks × events)
-                current_step = engine.state.position.step
-                for track in engine.state.tracks.values():
-                    # Events would be processed here
-                    _ = track.get_events_at(current_step)
-
-                engine.state.advance_step()
-                engine._step_count += 1
-                processed_steps += 1
-
-            await asyncio.sleep(0.001)
+        # Drift resets fire inside the loop just like the real engine
+        processed_steps = await run_step_loop(engine, duration, on_step)
 
         engine.handle_stop({})
 
@@ -660,28 +687,19 @@ class TestHighEventDensity:
         print("Tracks: 16, Events per track: 16")
         print(f"Steps processed: {processed_steps} (expected ~{expected_steps})")
         print(f"Max drift: {drift_stats['max_drift_ms']:.2f}ms")
-        print(f"OSC events sent: {len(mock_osc.events)}")
+        print(f"Scheduled messages: {engine._message_scheduler.message_count}")
 
     @pytest.mark.asyncio
     async def test_rapid_compile_during_playback(
         self,
-        mock_osc: MockOscOutput,
-        mock_midi: MockMidiOutput,
-        mock_commands: MockCommandSource,
-        mock_publisher: MockStateSink,
+        stability_engine: StabilityTestEngine,
     ):
         """Test recompiling session while playing (live coding scenario)."""
-        engine = LoopEngine(
-            osc=mock_osc,
-            midi=mock_midi,
-            commands=mock_commands,
-            publisher=mock_publisher,
-        )
-        engine._register_handlers()
+        engine = stability_engine.engine
 
         # Initial session
         session = create_dense_session(num_tracks=4)
-        engine._handle_compile(session)
+        load_session(engine, session)
         engine.state.set_bpm(120)
         engine.handle_play({})
 
@@ -690,24 +708,36 @@ class TestHighEventDensity:
 
         compile_count = 0
         errors: list[str] = []
-        start_time = time.perf_counter()
+        duration = 3
+        interval = 0.5
+
+        # Recompile every 500ms (simulating live coding). The timers are
+        # armed up front and set an Event, so the test sleeps between
+        # compiles instead of polling for the next slot.
+        loop = asyncio.get_running_loop()
+        trigger = asyncio.Event()
+        start_time = loop.time()
+        num_compiles = int(duration / interval) - 1
+        for i in range(1, num_compiles + 1):
+            loop.call_at(start_time + i * interval, trigger.set)
+
+        for _ in range(num_compiles):
+            await trigger.wait()
+            trigger.clear()
+            try:
+                new_session = create_dense_session(num_tracks=4 + compile_count)
+                load_session(engine, new_session)
+                compile_count += 1
 
-        while time.perf_counter() - start_time < 3:
-            # Recompile every 500ms (simulating live coding)
-            if int((time.perf_counter() - start_time) * 2) > compile_count:
-                try:
-                    new_session = create_dense_session(num_tracks=4 + compile_count)
-                    engine._handle_compile(new_session)
-                    compile_count += 1
+                # Verify engine is still playing
+                if not engine.state.playing:
+                    errors.append(f"Playback stopped after compile {compile_count}")
 
-                    # Verify engine is still playing
-                    if not engine.state.playing:
-                        errors.append(f"Playback stopped after compile {compile_count}")
+            except Exception as e:
+                errors.append(f"Compile error: {e}")
 
-                except Exception as e:
-                    errors.append(f"Compile error: {e}")
-
-            await asyncio.sleep(0.01)
+        # Keep playing out the rest of the window after the last compile
+        await asyncio.sleep(max(0.0, start_time + duration - loop.time()))
 
         engine.handle_stop({})
 
@@ -728,45 +758,17 @@ class TestHighEventDensity:
 class TestStabilitySummary:
     """Summary test that runs quick versions of all stability checks."""
 
-    @pytest.mark.asyncio
-    async def test_comprehensive_stability_check(
-        self,
-        mock_osc: MockOscOutput,
-        mock_midi: MockMidiOutput,
-        mock_commands: MockCommandSource,
-        mock_publisher: MockStateSink,
-    ):
-        """Quick comprehensive stability check (2 second version of each test)."""
-        engine = LoopEngine(
-            osc=mock_osc,
-            midi=mock_midi,
-            commands=mock_commands,
-            publisher=mock_publisher,
-        )
-        engine._register_handlers()
-
-        results: dict[str, bool] = {}
-
-        # 1. Basic timing (2s)
+    @staticmethod
+    async def _check_timing(engine: LoopEngine) -> bool:
+        """Basic timing (2s): no drift resets at a steady tempo."""
         engine.state.set_bpm(120)
         engine.handle_play({})
-        engine._step_anchor_time = time.perf_counter()
-        engine._step_count = 0
+        await run_step_loop(engine, 2)
+        return engine._drift_stats["reset_count"] == 0
 
-        start = time.perf_counter()
-        while time.perf_counter() - start < 2:
-            current = time.perf_counter()
-            expected = engine._step_anchor_time + (
-                engine._step_count * engine.state.step_duration
-            )
-            if current >= expected:
-                engine._step_count += 1
-            await asyncio.sleep(0.001)
-
-        results["timing"] = engine._drift_stats["reset_count"] == 0
-        engine.handle_stop({})
-
-        # 2. BPM changes
+    @staticmethod
+    async def _check_bpm_changes(engine: LoopEngine) -> bool:
+        """BPM changes during playback raise no errors."""
         engine.handle_play({})
         engine._step_anchor_time = time.perf_counter()
         engine._clock_generator._clock_anchor_time = time.perf_counter()
@@ -779,10 +781,11 @@ class TestStabilitySummary:
                 bpm_errors += 1
             await asyncio.sleep(0.01)
 
-        results["bpm_changes"] = bpm_errors == 0
-        engine.handle_stop({})
+        return bpm_errors == 0
 
-        # 3. CPU spike recovery
+    @staticmethod
+    async def _check_spike_recovery(engine: LoopEngine) -> bool:
+        """A small spike is handled without crashing."""
         engine.handle_play({})
         engine._step_anchor_time = time.perf_counter()
         engine._step_count = 0
@@ -797,13 +800,25 @@ class TestStabilitySummary:
         if abs(drift_ms) > engine.DRIFT_RESET_THRESHOLD_MS:
             await engine._handle_drift_reset(drift_ms, current)
 
-        results["spike_recovery"] = True  # Just verify no crash
+        return True  # Just verify no crash
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "phase", ["timing", "bpm_changes", "spike_recovery"]
+    )
+    async def test_comprehensive_stability_check(
+        self,
+        stability_engine: StabilityTestEngine,
+        phase: str,
+    ):
+        """Quick stability check, one parametrized case per phase."""
+        check = getattr(self, f"_check_{phase}")
+        engine = stability_engine.engine
+
+        passed = await check(engine)
         engine.handle_stop({})
 
-        # Print results
-        print("\n=== Comprehensive Stability Check ===")
-        for test_name, passed in results.items():
-            status = "✓ PASS" if passed else "✗ FAIL"
-            print(f"  {test_name}: {status}")
+        status = "✓ PASS" if passed else "✗ FAIL"
+        print(f"\n=== Comprehensive Stability Check: {phase}: {status} ===")
 
-        assert all(results.values()), f"Some checks failed: {results}"
+        assert passed, f"Stability check failed: {phase}"
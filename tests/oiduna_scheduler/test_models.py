@@ -68,6 +68,17 @@ class TestScheduledMessage:
         assert msg.step == 24
         assert msg.params == {"note": 60, "velocity": 100}
 
+    def test_from_dict_interns_destination_id(self):
+        """Test that decoded destination ids share one string object."""
+        # Built at runtime so the literal is not interned by the compiler
+        dest = "".join(["super", "dirt"])
+        data = {"destination_id": dest, "cycle": 0.0, "step": 0, "params": {}}
+
+        msg1 = ScheduledMessage.from_dict(data)
+        msg2 = ScheduledMessage.from_dict(dict(data, destination_id="".join(["super", "dirt"])))
+
+        assert msg1.destination_id is msg2.destination_id
+
     def test_round_trip_serialization(self):
         """Test dict serialization round trip."""
         original = ScheduledMessage(
@@ -114,6 +125,14 @@ class TestScheduledMessageBatch:
         with pytest.raises(AttributeError):
             batch.bpm = 140.0  # type: ignore
 
+    def test_slotted(self):
+        """Test that messages and batches carry no per-instance __dict__."""
+        msg = ScheduledMessage("superdirt", 1.0, 0, {"s": "bd"})
+        batch = ScheduledMessageBatch(messages=(msg,))
+
+        assert not hasattr(msg, "__dict__")
+        assert not hasattr(batch, "__dict__")
+
     def test_default_values(self):
         """Test batch default values."""
         batch = ScheduledMessageBatch(messages=())
@@ -2,7 +2,6 @@
 
 import pytest
 from typing import List, Dict, Any
-from collections import defaultdict
 
 from scheduler_models import ScheduledMessage
 from router import DestinationRouter
@@ -12,7 +11,8 @@ from validators import OscValidator, MidiValidator
 class MockDestinationSender:
     """Mock destination sender for testing."""
 
-    def __init__(self):
+    def __init__(self, use_bundle: bool = False):
+        self.use_bundle = use_bundle
         self.messages: List[Dict[str, Any]] = []
         self.bundles: List[List[Dict[str, Any]]] = []
 
@@ -236,6 +236,34 @@ class TestDestinationRouter:
         assert sender.messages[0] == {"s": "bd", "gain": 0.8}
         assert sender.messages[1] == {"s": "hh", "pan": 0.5}
 
+    def test_bundle_sender_receives_one_bundle(self):
+        """Test that a use_bundle destination gets its messages as one bundle."""
+        router = DestinationRouter()
+        sender = MockDestinationSender(use_bundle=True)
+        router.register_destination("superdirt", sender, protocol="osc")
+
+        msg1 = ScheduledMessage("superdirt", 1.0, 0, {"s": "bd"})
+        msg2 = ScheduledMessage("superdirt", 1.0, 0, {"s": "sn"})
+
+        router.send_messages([msg1, msg2])
+
+        assert sender.messages == []
+        assert sender.bundles == [[{"s": "bd"}, {"s": "sn"}]]
+
+    def test_bundle_sender_single_valid_message_skips_bundle(self):
+        """Test that a lone surviving message is sent without a bundle."""
+        router = DestinationRouter()
+        sender = MockDestinationSender(use_bundle=True)
+        router.register_destination("superdirt", sender, protocol="osc")
+
+        msg1 = ScheduledMessage("superdirt", 1.0, 0, {"s": "bd"})  # Valid
+        msg2 = ScheduledMessage("superdirt", 1.0, 0, {"s": "sn", "notes": [1, 2]})  # Invalid
+
+        router.send_messages([msg1, msg2])
+
+        assert sender.messages == [{"s": "bd"}]
+        assert sender.bundles == []
+
     def test_custom_validators(self):
         """Test router with custom validators."""
         custom_osc = OscValidator()